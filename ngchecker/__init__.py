@@ -1,12 +1,28 @@
 import re
-from astropy import units as u, constants as c
+import sys
+from collections import namedtuple
 import numpy as np
-from typing import List, Tuple, Optional, Dict, Union
-import pint.models
-import pint.toa
+from typing import TYPE_CHECKING, List, Tuple, Optional, Dict, Union
 from loguru import logger as log
 
-# these can be set elsewhere or overridden if needed
+# pint (and the astropy stack it pulls in) is slow to import, so defer it:
+# the checkers only ever receive already-constructed pint objects
+if TYPE_CHECKING:
+    import pint.models
+    import pint.toa
+
+
+def __getattr__(name):
+    if name == "pint":
+        import pint
+
+        return pint
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# these can be set elsewhere or overridden if needed; call
+# recompile_binary_params() afterward since the checkers read a compiled
+# snapshot taken at import time
 # format is:
 # top-level block:
 #   can be specified by ``all`` (applies to all entries)
@@ -32,29 +48,246 @@ binary_params = {
     },
     "DD": {
         "all": {
-            "required": ["A1" "E", "T0", "PB", "OM"],
+            "required": ["A1", "ECC", "T0", "PB", "OM"],
             "optional": ["PBDOT", "A1DOT", "OMDOT", "EDOT"],
             "optional_sets": [["EPS1DOT", "EPS2DOT"]],
         }
     },
     "DDK": {
         "all": {
-            "required": ["A1", "E", "T0", "PB", "OM", "M2", "K96", "KOM", "KIN"],
+            "required": ["A1", "ECC", "T0", "PB", "OM", "M2", "K96", "KOM", "KIN"],
             "optional": ["PBDOT", "A1DOT", "OMDOT", "EDOT"],
         }
     },
 }
 
+# a single block of the schema above, flattened for fast iteration:
+# ``trigger`` is None for an ``all`` block, otherwise the parameter that enables it
+CompiledBlock = namedtuple(
+    "CompiledBlock", ["trigger", "required", "optional", "optional_sets"]
+)
+
+
+def _pint_param_names() -> Optional[Tuple[set, Dict]]:
+    """Collect pint's parameter namespace, if pint has been imported
+
+    Returns
+    -------
+    tuple or None
+        ``(canonical, aliases)`` where ``canonical`` is the set of canonical
+        parameter names across all model components and ``aliases`` maps each
+        alias (e.g., ``E``) to its canonical name (``ECC``), or None if
+        ``pint.models`` has not been imported yet
+    """
+    pint_models = sys.modules.get("pint.models")
+    if pint_models is None:
+        return None
+    canonical = set()
+    aliases = {}
+    for component_type in pint_models.timing_model.Component.component_types.values():
+        component = component_type()
+        for p in component.params:
+            canonical.add(p)
+            for a in getattr(component, p).aliases:
+                aliases[a] = p
+    return canonical, aliases
+
+
+def _compile_binary_params(params: Dict = binary_params) -> Dict:
+    """Flatten the nested ``binary_params`` dict into tuples of ``CompiledBlock``
+
+    If pint has been imported, alias parameter names (e.g., ``E``) are
+    rewritten to their canonical forms (``ECC``), since the checks resolve
+    names against the model's canonical ``params``.
+
+    Parameters
+    ----------
+    params : dict
+        Schema in the same format as ``binary_params``
+
+    Returns
+    -------
+    dict
+        Mapping of binary model name to a tuple of ``CompiledBlock``
+    """
+    names = _pint_param_names()
+    aliases = {} if names is None else names[1]
+
+    def canon(p):
+        return aliases.get(p, p)
+
+    compiled = {}
+    for model, blocks in params.items():
+        records = []
+        for trigger, spec in blocks.items():
+            records.append(
+                CompiledBlock(
+                    None if trigger == "all" else canon(trigger),
+                    tuple(canon(p) for p in spec.get("required", ())),
+                    tuple(canon(p) for p in spec.get("optional", ())),
+                    tuple(
+                        tuple(canon(p) for p in s)
+                        for s in spec.get("optional_sets", ())
+                    ),
+                )
+            )
+        compiled[model] = tuple(records)
+    return compiled
+
+
+# compiled once at import so every BinaryChecker shares the same schema
+_COMPILED_BINARY = _compile_binary_params()
+
+
+def _validate_binary_params(compiled: Dict = _COMPILED_BINARY):
+    """Check that every required schema parameter is a canonical pint parameter name
+
+    Guards against typos like implicit string concatenation (``"A1" "E"`` ->
+    ``"A1E"``) silently turning a required check into a no-op: unknown names
+    are logged as warnings.  The checks resolve names against the model's
+    canonical ``params``, so only canonical names count as known here;
+    aliases are rewritten during compilation.  Skipped when pint has not been
+    imported yet, since the imports here are deferred.
+    """
+    names = _pint_param_names()
+    if names is None:
+        return
+    canonical = names[0]
+    for model, blocks in compiled.items():
+        for block in blocks:
+            for p in block.required:
+                if p not in canonical:
+                    log.warning(
+                        f"binary_params['{model}'] requires unknown parameter '{p}'"
+                    )
+
+
+_validate_binary_params()
+
+
+def recompile_binary_params():
+    """Rebuild the compiled schema after ``binary_params`` has been modified
+
+    ``BinaryChecker`` reads the compiled snapshot taken at import time, so
+    runtime overrides of ``binary_params`` only take effect after calling this.
+    """
+    global _COMPILED_BINARY
+    _COMPILED_BINARY = _compile_binary_params()
+    _validate_binary_params(_COMPILED_BINARY)
+
+
+# J2000 or B1950 pulsar names, compiled once so NameChecker does a single match
+_PSR_NAME_RE = re.compile(r"(?:J\d{4}[+-]\d{4}|B\d{4}[+-]\d{2})")
+
+# sentinel marking a parameter that must be absent (vs one that must equal a value)
+_EXCLUDED = object()
+
+# below this many jump index arrays the numba kernel is not worth its overhead
+_NUMBA_UNION_MIN_JUMPS = 16
+# (kernel, typed-list constructor) once compiled, or False if numba is unavailable
+_union_kernel = None
+
+
+def _union_masks(flags: np.ndarray, index_arrays: List[np.ndarray]):
+    """
+    Set ``flags[i] = True`` for every index in every array of ``index_arrays``
+
+    The union of many jump masks is memory-bound: per-jump fancy-indexing
+    assignment reloads the target array once per jump.  When there are many
+    index arrays and numba is installed, a compiled kernel walks them all in a
+    single call; otherwise this falls back to plain NumPy assignments.
+
+    Parameters
+    ----------
+    flags : np.ndarray
+        Boolean mask to update in place
+    index_arrays : list of np.ndarray
+        Integer index arrays to union into ``flags``
+    """
+    global _union_kernel
+    if len(index_arrays) >= _NUMBA_UNION_MIN_JUMPS:
+        if _union_kernel is None:
+            try:
+                from numba import njit
+                from numba.typed import List as NumbaList
+
+                @njit(cache=True)
+                def _union(flags, arrs):
+                    for a in arrs:
+                        for i in range(a.size):
+                            flags[a[i]] = True
+
+                _union_kernel = (_union, NumbaList)
+            except ImportError:
+                _union_kernel = False
+        if _union_kernel:
+            kernel, NumbaList = _union_kernel
+            arrs = NumbaList()
+            for idx in index_arrays:
+                arrs.append(np.asarray(idx, dtype=np.int64))
+            kernel(flags, arrs)
+            return
+    for idx in index_arrays:
+        flags[idx] = True
+
 
 class DataChecker:
-    def __init__(self, model: pint.models.TimingModel, toas: pint.toa.TOAs):
+    def __init__(self, model: "pint.models.TimingModel", toas: "pint.toa.TOAs"):
         """
         Check data sets (timing model and TOAs) for problems.
 
         Abstract class that should be sub-classed for specific cases.
+
+        The model is assumed to be stationary while checking: parameter
+        values and frozen states are snapshotted here.  Call :meth:`refresh`
+        if the model is modified between checks.
         """
         self.m = model
         self.t = toas
+        self._snapshot = {p: (model[p].value, model[p].frozen) for p in model.params}
+        # lazily-filled cache of dictionary-encoded string TOA columns
+        self._column_codes = {}
+
+    def refresh(self):
+        """Rebuild the cached value/frozen snapshot after the model has been modified"""
+        self._snapshot = {p: (self.m[p].value, self.m[p].frozen) for p in self.m.params}
+
+    @classmethod
+    def _from_parent(cls, parent: "DataChecker") -> "DataChecker":
+        """
+        Construct a checker that shares another checker's cached model state
+
+        Skips re-deriving the value/frozen snapshot that ``__init__`` would
+        rebuild for the same model.
+        """
+        obj = cls.__new__(cls)
+        obj.m = parent.m
+        obj.t = parent.t
+        obj._snapshot = parent._snapshot
+        obj._column_codes = parent._column_codes
+        return obj
+
+    def _toa_column_codes(self, name: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Dictionary-encode a string TOA column for fast integer comparisons
+
+        String equality on an object-dtype column compares Python objects
+        row-by-row; comparing the integer codes instead is vectorized.
+
+        Parameters
+        ----------
+        name : str
+            TOA column name (e.g., ``"be"`` or ``"ver"``)
+
+        Returns
+        -------
+        tuple
+            ``(categories, codes)``: the sorted unique values and, for each
+            TOA, the index of its value in ``categories``
+        """
+        if name not in self._column_codes:
+            self._column_codes[name] = np.unique(self.t[name], return_inverse=True)
+        return self._column_codes[name]
 
     def check(self):
         raise NotImplementedError("This class should not be used directly")
@@ -104,14 +337,15 @@ class DataChecker:
         KeyError
             If the check fails and ``raiseexcept`` is True
         """
-        if not (p in self.m.params and self.m[p].value is not None):
+        entry = self._snapshot.get(p)
+        if entry is None or entry[0] is None:
             self.raise_or_warn(
                 f"Parameter '{p}' not found in timing model",
                 KeyError if raiseexcept else None,
             )
             return False
         if require_unfrozen:
-            if self.m[p].frozen:
+            if entry[1]:
                 self.raise_or_warn(
                     f"Parameter '{p}' found in timing model but frozen",
                     KeyError if raiseexcept else None,
@@ -149,10 +383,11 @@ class DataChecker:
         KeyError
             If the check fails and ``raiseexcept`` is True
         """
-        if p not in self.m.params or self.m[p].value is None:
+        entry = self._snapshot.get(p)
+        if entry is None or entry[0] is None:
             return True
         if require_unfrozen:
-            if self.m[p].frozen:
+            if entry[1]:
                 self.raise_or_warn(
                     f"Parameter '{p}' found in timing model but frozen",
                     KeyError if raiseexcept else None,
@@ -189,12 +424,10 @@ class DataChecker:
             If the check fails and ``raiseexcept`` is True
         """
         return all(
-            [
-                self.check_parameter(
-                    x, raiseexcept=raiseexcept, require_unfrozen=require_unfrozen
-                )
-                for x in p
-            ]
+            self.check_parameter(
+                x, raiseexcept=raiseexcept, require_unfrozen=require_unfrozen
+            )
+            for x in p
         )
 
     def check_optional_parameter_sets(
@@ -225,30 +458,40 @@ class DataChecker:
         KeyError
             If the check fails and ``raiseexcept`` is True
         """
-        if any([x in self.m.params for x in p]) and not all(
-            [x in self.m.params for x in p]
-        ):
+        # a single pass over the parameters, with one snapshot lookup each
+        present = 0
+        unset = 0
+        frozen_bad = False
+        for x in p:
+            entry = self._snapshot.get(x)
+            if entry is None:
+                continue
+            present += 1
+            if entry[0] is None:
+                unset += 1
+            elif entry[1]:
+                frozen_bad = True
+        if 0 < present < len(p):
             self.raise_or_warn(
                 f"All parameters '{p}' not found in timing model",
                 KeyError if raiseexcept else None,
             )
             return False
-        if all([self.m[x].value is None for x in p]):
+        if unset == present:
             # parameters are there, but all are unset
             return True
-        if any([self.m[x].value is None for x in p]):
+        if unset > 0:
             self.raise_or_warn(
                 f"All parameters '{p}' found in timing model but some unset",
                 KeyError if raiseexcept else None,
             )
             return False
-        if require_unfrozen:
-            if any([self.m[x].frozen for x in p]):
-                self.raise_or_warn(
-                    f"All parameters '{p}' found in timing model but some frozen",
-                    KeyError if raiseexcept else None,
-                )
-                return False
+        if require_unfrozen and frozen_bad:
+            self.raise_or_warn(
+                f"All parameters '{p}' found in timing model but some frozen",
+                KeyError if raiseexcept else None,
+            )
+            return False
         return True
 
 
@@ -273,9 +516,7 @@ class NameChecker(DataChecker):
         KeyError
             If the check fails and ``raiseexcept`` is True
         """
-        value = re.match(r"J\d{4}[+-]\d{4}", self.m.PSR.value) or re.match(
-            r"B\d{4}[+-]\d{2}", self.m.PSR.value
-        )
+        value = _PSR_NAME_RE.match(self.m.PSR.value)
         if not value:
             self.raise_or_warn(
                 f"Pulsar name '{self.m.PSR.value}' does not match required format",
@@ -290,14 +531,24 @@ class BinaryChecker(DataChecker):
 
     """
 
-    def __init__(self, model: pint.models.TimingModel, toas: pint.toa.TOAs):
+    def __init__(self, model: "pint.models.TimingModel", toas: "pint.toa.TOAs"):
         super().__init__(model, toas)
+        self._load_binary_schema()
+
+    def _load_binary_schema(self):
+        """Look up the compiled schema for the model's binary type"""
         if self.m.is_binary:
-            if not self.m["BINARY"].value in binary_params.keys():
+            if not self.m["BINARY"].value in _COMPILED_BINARY.keys():
                 raise KeyError(
                     f"Binary parameters not found: {self.m['BINARY'].value} not supported"
                 )
-            self.binary_params = binary_params[self.m["BINARY"].value]
+            self.binary_params = _COMPILED_BINARY[self.m["BINARY"].value]
+
+    @classmethod
+    def _from_parent(cls, parent: DataChecker) -> "BinaryChecker":
+        obj = super()._from_parent(parent)
+        obj._load_binary_schema()
+        return obj
 
     def check(self, raiseexcept: Optional[bool] = True) -> bool:
         """
@@ -320,24 +571,23 @@ class BinaryChecker(DataChecker):
         if not self.m.is_binary:
             return True
 
-        for k in self.binary_params:
-            if k != "all" and (k not in self.m.params or self.m[k] is None):
+        value = True
+        for block in self.binary_params:
+            if block.trigger is not None and block.trigger not in self._snapshot:
                 continue
             value = self.check_parameter_set(
-                self.binary_params[k]["required"],
+                block.required,
                 require_unfrozen=True,
                 raiseexcept=raiseexcept,
             )
-            if "optional" in self.binary_params[k]:
-                for p in self.binary_params[k]["optional"]:
-                    value = value and self.check_optional_parameter(
-                        p, require_unfrozen=True, raiseexcept=raiseexcept
-                    )
-            if "optional_sets" in self.binary_params[k]:
-                for p in self.binary_params[k]["optional_sets"]:
-                    value = value and self.check_optional_parameter_sets(
-                        p, require_unfrozen=True, raiseexcept=raiseexcept
-                    )
+            for p in block.optional:
+                value = value and self.check_optional_parameter(
+                    p, require_unfrozen=True, raiseexcept=raiseexcept
+                )
+            for p in block.optional_sets:
+                value = value and self.check_optional_parameter_sets(
+                    p, require_unfrozen=True, raiseexcept=raiseexcept
+                )
         return value
 
 
@@ -394,23 +644,28 @@ class ParChecker(DataChecker):
         )
         if not value:
             return value
-        for p in excluded:
-            if p in self.m.params and self.m[p].value is not None:
-                self.raise_or_warn(
-                    f"Excluded parameter '{p}' is  present in timing model",
-                    KeyError if raiseexcept else None,
-                )
-                return False
-        for p in required_value.keys():
-            if not (self.m[p].value == required_value[p]):
+        # excluded and required-value parameters in a single pass, before the
+        # (more expensive) sub-checkers run
+        for p, expected in [(p, _EXCLUDED) for p in excluded] + list(
+            required_value.items()
+        ):
+            entry = self._snapshot.get(p)
+            if expected is _EXCLUDED:
+                if entry is not None and entry[0] is not None:
+                    self.raise_or_warn(
+                        f"Excluded parameter '{p}' is  present in timing model",
+                        KeyError if raiseexcept else None,
+                    )
+                    return False
+            elif not (entry[0] == expected):
                 self.raise_or_warn(
-                    f"Required parameter '{p}' is present, but value is '{self.m[p].value}, not {required_value[p]}",
+                    f"Required parameter '{p}' is present, but value is '{entry[0]}, not {expected}",
                     KeyError if raiseexcept else None,
                 )
                 return False
         if othercheckers is not None:
             for checkername in othercheckers:
-                checker = checkername(self.m, self.t)
+                checker = checkername._from_parent(self)
                 value = checker.check(raiseexcept=raiseexcept)
                 if not value:
                     return False
@@ -451,24 +706,42 @@ class TOAChecker(DataChecker):
         ValueError
             If the check fails and ``raiseexcept`` is True
         """
-        value = np.all(self.t["ver"] == version)
+        ver_cats, _ = self._toa_column_codes("ver")
+        value = ver_cats.size == 1 and ver_cats[0] == version
         if not value:
             self.raise_or_warn(
                 f"TOA version is not '{version}' for all TOAs",
                 ValueError if raiseexcept else None,
             )
             return False
+        if len(badranges) == 0:
+            return True
+        # one vectorized pass over all TOAs regardless of the number of backends
+        # materialize the float MJDs once; .to_value avoids an extra copy when
+        # the Quantity is already in days
+        all_mjds = np.asarray(self.t.get_mjds().to_value("d"))
+        be_cats, be_codes = self._toa_column_codes("be")
+        # per-category MJD limits; inf/-inf sentinels mean "no bad range"
+        lo = np.full(be_cats.size, np.inf)
+        hi = np.full(be_cats.size, -np.inf)
+        codes = {}
         for k in badranges.keys():
-            mjds = self.t.get_mjds()[self.t["be"] == k].value
-            filtered_mjds = (mjds >= badranges[k][0]) and (mjds <= badranges[k][1])
-            value = np.any(filtered_mjds)
-            if value:
-                self.raise_or_warn(
-                    f"TOAs for backend '{k}' contain {filtered_mjds.sum()} values between MJD {badranges[k][0]} and {badranges[k][1]}",
-                    ValueError if raiseexcept else None,
-                )
-            return False
-        return True
+            j = np.searchsorted(be_cats, k)
+            if j < be_cats.size and be_cats[j] == k:
+                codes[k] = j
+                lo[j], hi[j] = badranges[k]
+        bad = (all_mjds >= lo[be_codes]) & (all_mjds <= hi[be_codes])
+        value = True
+        if bad.any():
+            for k, j in codes.items():
+                n = int(np.count_nonzero(bad & (be_codes == j)))
+                if n > 0:
+                    self.raise_or_warn(
+                        f"TOAs for backend '{k}' contain {n} values between MJD {badranges[k][0]} and {badranges[k][1]}",
+                        ValueError if raiseexcept else None,
+                    )
+                    value = False
+        return value
 
 
 class JumpChecker(DataChecker):
@@ -478,20 +751,35 @@ class JumpChecker(DataChecker):
     All TOAs should be covered by JUMPs or -to flags except for a set defined by a single list of flags
     """
 
-    def check(
+    def _check_jump_component(
         self,
-        keys: Optional[List[Tuple]] = [("f"), ("fe", "be")],
+        component: str,
+        jumpname: str,
+        covered: str,
+        uncovered: str,
+        keys: List[Tuple],
         raiseexcept: Optional[bool] = True,
+        jump_or_offset: Optional[np.ndarray] = None,
     ) -> bool:
         """
-        Check the data
+        Check coverage for a single jump component (PhaseJump or DispersionJump)
 
         Parameters
         ----------
-        keys: list of tuples, optional
+        component : str
+            Name of the jump component in the timing model
+        jumpname : str
+            Name of a single jump for messages (e.g., "Jump" or "DMJump")
+        covered : str
+            Description of full coverage for messages (e.g., "a JUMP or -to flag")
+        uncovered : str
+            Description of partial coverage for messages (e.g., "JUMPs or -to flags")
+        keys: list of tuples
             Each element of the list is a set of one or more TOA flags to check for establishing a single dataset
         raiseexcept: bool, optional
             Will an error raise an exception (default) or just a warning
+        jump_or_offset : np.ndarray, optional
+            Boolean mask of TOAs already covered (e.g., by -to flags)
 
         Returns
         -------
@@ -503,82 +791,90 @@ class JumpChecker(DataChecker):
         KeyError
             If the check fails and ``raiseexcept`` is True
         """
-        jump_or_offset = np.zeros(len(self.t), dtype=bool)
-        offsets, offset_indices = self.t.get_flag_value("to", np.nan, float)
-        if len(offset_indices) > 0:
-            jump_or_offset[np.array(offset_indices)] = True
-        jump_indices = {}
-        for p in self.m.components["PhaseJump"].params:
-            jump_indices[p] = self.m[p].select_toa_mask(self.t)
-            if (len(jump_indices[p]) == 0) and (not self.m[p].frozen):
+        N = len(self.t)
+        toas = self.t
+        if jump_or_offset is None:
+            jump_or_offset = np.zeros(N, dtype=bool)
+        index_arrays = []
+        for p in self.m.components[component].params:
+            idx = self.m[p].select_toa_mask(toas)
+            if (len(idx) == 0) and (not self.m[p].frozen):
                 v = " ".join(self.m[p].key_value)
                 self.raise_or_warn(
-                    f"Jump '{p}' = '{self.m[p].key} {v}' has 0 TOAs but is not frozen",
+                    f"{jumpname} '{p}' = '{self.m[p].key} {v}' has 0 TOAs but is not frozen",
                     KeyError if raiseexcept else None,
                 )
-            jump_or_offset[jump_indices[p]] = True
-        not_jumped_or_offset = np.setdiff1d(
-            np.arange(len(self.t)), np.where(jump_or_offset)[0]
-        )
+            index_arrays.append(idx)
+        _union_masks(jump_or_offset, index_arrays)
+        not_jumped_or_offset = np.flatnonzero(~jump_or_offset)
         if len(not_jumped_or_offset) == 0:
             self.raise_or_warn(
-                f"All {len(self.t)} TOAs are covered by a JUMP or -to flag",
+                f"All {N} TOAs are covered by {covered}",
                 KeyError if raiseexcept else None,
             )
             return False
-        keyset = []
-        passes = False
         for k in keys:
-            keyset.append(np.array(self.t[k][not_jumped_or_offset]))
-            if len(np.unique(keyset[-1])) == 1:
+            col = np.array(toas[k][not_jumped_or_offset])
+            # all-equal test is a single O(N) pass; np.unique would sort
+            if col.size and not (col != col[0]).any():
                 log.info(
-                    f"{len(not_jumped_or_offset)} TOAs are not covered by JUMPs or -to flags, but have the same value of '{k}' = '{list(np.unique(keyset[-1]))}'"
+                    f"{len(not_jumped_or_offset)} TOAs are not covered by {uncovered}, but have the same value of '{k}' = '{list(np.unique(col))}'"
                 )
-                passes = True
-                break
-        if not passes:
-            self.raise_or_warn(
-                f"{len(not_jumped_or_offset)} TOAs are not covered by JUMPs or -to flags and do not have common sets of flags",
-                KeyError if raiseexcept else None,
-            )
+                return True
+        self.raise_or_warn(
+            f"{len(not_jumped_or_offset)} TOAs are not covered by {uncovered} and do not have common sets of flags",
+            KeyError if raiseexcept else None,
+        )
+        return False
+
+    def check(
+        self,
+        keys: Optional[List[Tuple]] = [("f"), ("fe", "be")],
+        raiseexcept: Optional[bool] = True,
+    ) -> bool:
+        """
+        Check the data
+
+        Parameters
+        ----------
+        keys: list of tuples, optional
+            Each element of the list is a set of one or more TOA flags to check for establishing a single dataset
+        raiseexcept: bool, optional
+            Will an error raise an exception (default) or just a warning
+
+        Returns
+        -------
+        bool
+            True if the checks pass, False otherwise
+
+        Raises
+        ------
+        KeyError
+            If the check fails and ``raiseexcept`` is True
+        """
+        jump_or_offset = np.zeros(len(self.t), dtype=bool)
+        offsets, offset_indices = self.t.get_flag_value("to", np.nan, float)
+        if len(offset_indices) > 0:
+            jump_or_offset[np.array(offset_indices)] = True
+        if not self._check_jump_component(
+            "PhaseJump",
+            "Jump",
+            "a JUMP or -to flag",
+            "JUMPs or -to flags",
+            keys,
+            raiseexcept=raiseexcept,
+            jump_or_offset=jump_or_offset,
+        ):
             return False
 
         if self.t.is_wideband():
-            jump_or_offset = np.zeros(len(self.t), dtype=bool)
-            jump_indices = {}
-            for p in self.m.components["DispersionJump"].params:
-                jump_indices[p] = self.m[p].select_toa_mask(t)
-                if (len(jump_indices[p]) == 0) and (not self.m[p].frozen):
-                    v = " ".join(self.m[p].key_value)
-                    self.raise_or_warn(
-                        f"DMJump '{p}' = '{self.m[p].key} {v}' has 0 TOAs but is not frozen",
-                        KeyError if raiseexcept else None,
-                    )
-                jump_or_offset[jump_indices[p]] = True
-            not_jumped_or_offset = np.setdiff1d(
-                np.arange(len(self.t)), np.where(jump_or_offset)[0]
+            return self._check_jump_component(
+                "DispersionJump",
+                "DMJump",
+                "a DMJUMP",
+                "DMJUMPs",
+                keys,
+                raiseexcept=raiseexcept,
             )
-            if len(not_jumped_or_offset) == 0:
-                self.raise_or_warn(
-                    f"All {len(self.t)} TOAs are covered by a DMJUMP",
-                    KeyError if raiseexcept else None,
-                )
-                return False
-            keyset = []
-            passes = False
-            for k in keys:
-                keyset.append(np.array(self.t[k][not_jumped_or_offset]))
-                if len(np.unique(keyset[-1])) == 1:
-                    log.info(
-                        f"{len(not_jumped_or_offset)} TOAs are not covered by DMJUMPs, but have the same value of '{k}' = '{list(np.unique(keyset[-1]))}'"
-                    )
-                    passes = True
-                    break
-            if not passes:
-                self.raise_or_warn(
-                    f"{len(not_jumped_or_offset)} TOAs are not covered by DMJUMPs and do not have common sets of flags",
-                    KeyError if raiseexcept else None,
-                )
-                return False
 
         return True